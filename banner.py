@@ -4,6 +4,8 @@ Banner display module for Tornet
 Provides ASCII art banner and visual formatting
 """
 
+import sys
+
 # ANSI color codes
 green = "\033[92m"
 red = "\033[91m"
@@ -11,15 +13,8 @@ white = "\033[97m"
 reset = "\033[0m"
 cyan = "\033[36m"
 
-
-def print_banner():
-    """
-    Display the Tornet ASCII art banner with colors.
-    
-    This function prints a stylized banner showing the TORNET logo
-    with the author attribution (suntzu).
-    """
-    banner = f"""
+# Assembled once at import so repeated calls are a single constant write.
+_BANNER = f"""
 {white} +-------------------------------------------------------+
 {white} |{green} ████████╗ ██████╗ ██████╗ ███╗   ██╗███████╗████████╗{white} |
 {white} |{green} ╚══██╔══╝██╔═══██╗██╔══██╗████╗  ██║██╔════╝╚══██╔══╝{white} |
@@ -29,4 +24,13 @@ def print_banner():
 {white} |{green}    ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═══╝╚══════╝   ╚═╝   {white} |
 {white} +---------------------{cyan}({red}suntzu{cyan}){white}----------------------+{reset}
 """
-    print(banner)
\ No newline at end of file
+
+
+def print_banner():
+    """
+    Display the Tornet ASCII art banner with colors.
+
+    This function prints a stylized banner showing the TORNET logo
+    with the author attribution (suntzu).
+    """
+    sys.stdout.write(_BANNER)
\ No newline at end of file
@@ -11,7 +11,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import utils
-from tornet import get_os_type, is_tor_installed
+from tornet import get_os_type, is_tor_installed, _timed_cache
 
 
 class TestUtils:
@@ -53,6 +53,20 @@ class TestTornet:
         os_type = get_os_type()
         assert os_type in ['Linux', 'macOS', 'Windows', 'Unknown']
 
+    def test_timed_cache(self):
+        """Test that _timed_cache memoizes results until cleared"""
+        calls = []
+
+        @_timed_cache(60)
+        def probe():
+            calls.append(1)
+            return len(calls)
+
+        assert probe() == 1
+        assert probe() == 1  # Cached, not re-invoked
+        probe.cache_clear()
+        assert probe() == 2  # Re-invoked after invalidation
+
     def test_is_tor_installed(self):
         """Test Tor installation detection"""
         # This test will pass regardless of whether Tor is installed
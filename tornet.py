@@ -11,37 +11,47 @@
 
 import os
 
+import io
+
 import time
 
-import argparse
+import atexit
 
-import requests
+import importlib.util
 
 import subprocess
 
+import shutil
+
+import functools
+
 import signal
 
+import socket
+
 import platform
 
 import sys
 
 import logging
 
-from datetime import datetime
+import logging.handlers
 
-# Import stem for Tor control port (install with: pip install stem)
+import threading
 
-try:
+import concurrent.futures
 
-    from stem.control import Controller
+# stem is used for the Tor control port (install with: pip install stem).
 
-    from stem import Signal
+# Availability is detected via find_spec so fast paths like --stop/--version
 
-    STEM_AVAILABLE = True
+# don't pay for importing the package; the actual import happens lazily in
 
-except ImportError:
+# the control-port helpers.
 
-    STEM_AVAILABLE = False
+STEM_AVAILABLE = importlib.util.find_spec('stem') is not None
+
+if not STEM_AVAILABLE:
 
     print("\n[!] 'stem' library not found. Falling back to service reload for IP changes.")
 
@@ -49,12 +59,80 @@ except ImportError:
 
 # Import local modules
 
-from utils import install_pip, install_requests, install_stem, install_tor
+from utils import install_pip, install_python_deps, install_tor
 
 from banner import print_banner
 
 TOOL_NAME = "tornet"
 
+# Persistent HTTP sessions so repeated IP checks reuse pooled connections
+
+# (keep-alive) instead of paying a TCP + TLS handshake per request. This
+
+# matters most over Tor, where every new connection means circuit setup.
+
+# Sessions are built lazily so importing requests (and its dependency tree)
+
+# is deferred until the first HTTP call.
+
+_SESSION = None
+
+_TOR_SESSION = None
+
+def _build_session(proxies=None):
+
+    """Builds a pooled requests.Session, registered for close at exit."""
+
+    import requests
+
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+
+    session.mount('http://', adapter)
+
+    session.mount('https://', adapter)
+
+    if proxies:
+
+        session.proxies = proxies
+
+    atexit.register(session.close)
+
+    return session
+
+def _get_session():
+
+    """Returns the shared direct-connection session, creating it on first use."""
+
+    global _SESSION
+
+    if _SESSION is None:
+
+        _SESSION = _build_session()
+
+    return _SESSION
+
+def _get_tor_session():
+
+    """Returns the shared Tor-proxied session, creating it on first use."""
+
+    global _TOR_SESSION
+
+    if _TOR_SESSION is None:
+
+        _TOR_SESSION = _build_session(proxies={
+
+            'http': 'socks5h://127.0.0.1:9050',
+
+            'https': 'socks5h://127.0.0.1:9050'
+
+        })
+
+    return _TOR_SESSION
+
 # ANSI color codes
 
 green = "\033[92m"
@@ -69,27 +147,115 @@ cyan = "\033[36m"
 
 yellow = "\033[93m" # Added yellow for warnings/debug
 
+# Common colored prefixes, assembled once instead of re-interpolated on every
+
+# print in the rotation loop.
+
+OK = f"{white} [{green}+{white}]{green} "
+
+INFO = f"{white} [{cyan}~{white}]{cyan} "
+
+WARN = f"{white} [{yellow}WARNING{white}] {yellow}"
+
+ERR = f"{white} [{red}!{white}] {red}"
+
+END = reset
+
 # Global variable for verbose mode
 
 VERBOSE_MODE = False
 
+def _enable_buffered_stdout():
+
+    """
+    Rebinds sys.stdout to a block-buffered writer.
+
+    With line buffering off, the many small status prints no longer trigger a
+    write() syscall per line; output is batched and flushed explicitly at the
+    end of each rotation cycle (and at exit).
+    """
+
+    if not hasattr(sys.stdout, 'buffer'):
+
+        return # Already wrapped or replaced (e.g. under test harnesses)
+
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=False, write_through=False)
+
+    atexit.register(lambda: sys.stdout.flush())
+
 # Configure logging
 
+# Log date stamp computed once at import; also guards against stacking
+
+# handlers on the root logger if setup_logging is called more than once.
+
+_TODAY = time.strftime("%Y%m%d")
+
+_LOGGING_CONFIGURED = False
+
+# Pre-create the logs directory once at import instead of stat'ing it on
+
+# every setup_logging call.
+
+os.makedirs('logs', exist_ok=True)
+
+def _schedule_log_flush(handler, interval=5.0):
+
+    """Flushes the buffered log handler every `interval` seconds via a daemon timer."""
+
+    def _flush_and_reschedule():
+
+        handler.flush()
+
+        _schedule_log_flush(handler, interval)
+
+    timer = threading.Timer(interval, _flush_and_reschedule)
+
+    timer.daemon = True
+
+    timer.start()
+
 def setup_logging(verbose=False):
 
-    """Configure logging based on verbosity level."""
+    """Configure logging based on verbosity level. Subsequent calls are no-ops."""
+
+    global _LOGGING_CONFIGURED
+
+    if _LOGGING_CONFIGURED:
+
+        return logging.getLogger(__name__)
 
     level = logging.DEBUG if verbose else logging.INFO
 
     log_format = '%(asctime)s - %(levelname)s - %(message)s'
 
-    
+    # Buffer file records in memory and flush in batches: verbose_print logs on
 
-    # Create logs directory if it doesn't exist
+    # every DEBUG event in the rotation loop, and an unbuffered FileHandler
 
-    os.makedirs('logs', exist_ok=True)
+    # would cost a write() syscall per line. ERROR and above still flush
 
-    
+    # immediately, and a background timer drains the buffer every few seconds.
+
+    file_handler = logging.FileHandler(f'logs/tornet_{_TODAY}.log')
+
+    # basicConfig only formats the handlers it is given (the MemoryHandler);
+
+    # flushed records are formatted by the target, so it needs the format too.
+
+    file_handler.setFormatter(logging.Formatter(log_format))
+
+    buffered_handler = logging.handlers.MemoryHandler(
+
+        capacity=512,
+
+        flushLevel=logging.ERROR,
+
+        target=file_handler,
+
+        flushOnClose=True
+
+    )
 
     # Configure logging to both file and console
 
@@ -101,7 +267,7 @@ def setup_logging(verbose=False):
 
         handlers=[
 
-            logging.FileHandler(f'logs/tornet_{datetime.now().strftime("%Y%m%d")}.log'),
+            buffered_handler,
 
             logging.StreamHandler(sys.stdout) if verbose else logging.NullHandler()
 
@@ -109,36 +275,66 @@ def setup_logging(verbose=False):
 
     )
 
-    
+    _schedule_log_flush(buffered_handler)
+
+    atexit.register(buffered_handler.flush)
+
+    _LOGGING_CONFIGURED = True
 
     return logging.getLogger(__name__)
 
-def get_os_type():
+# Detect the OS once at import time. sys.platform is a constant baked in at
 
-    """
-    Detects the operating system.
-    
-    Returns:
-        str: The operating system type - "Linux", "macOS", "Windows", or "Unknown"
-    """
+# interpreter start, so unlike platform.system() it costs nothing to read —
 
-    system = platform.system()
+# and get_os_type() is hit repeatedly from the service-control helpers and
 
-    if system == "Linux":
+# the IP rotation loop.
 
-        return "Linux"
+if sys.platform.startswith('linux'):
 
-    elif system == "Darwin":
+    _OS_TYPE = "Linux"
 
-        return "macOS"
+elif sys.platform == 'darwin':
 
-    elif system == "Windows":
+    _OS_TYPE = "macOS"
 
-        return "Windows"
+elif sys.platform in ('win32', 'cygwin'):
 
-    else:
+    _OS_TYPE = "Windows"
 
-        return "Unknown"
+else:
+
+    _OS_TYPE = "Unknown"
+
+# Candidate Tor install locations on Windows, built once at import rather
+
+# than re-joined on every is_tor_installed() call.
+
+if _OS_TYPE == "Windows":
+
+    _WIN_TOR_PATHS = (
+
+        os.path.join(os.environ.get("PROGRAMFILES", "C:\\Program Files"), "Tor Browser", "Browser", "TorBrowser", "Tor", "tor.exe"),
+
+        os.path.join(os.environ.get("PROGRAMFILES", "C:\\Program Files"), "Tor", "tor.exe"), # Example for standalone
+
+    )
+
+else:
+
+    _WIN_TOR_PATHS = ()
+
+def get_os_type():
+
+    """
+    Detects the operating system.
+
+    Returns:
+        str: The operating system type - "Linux", "macOS", "Windows", or "Unknown"
+    """
+
+    return _OS_TYPE
 
 def verbose_print(message):
 
@@ -146,7 +342,7 @@ def verbose_print(message):
 
     if VERBOSE_MODE:
 
-        print(f"{white} [{yellow}DEBUG{white}] {yellow}{message}{reset}")
+        print(f"{white} [{yellow}DEBUG{white}] {yellow}{message}{END}")
 
     
 
@@ -154,34 +350,75 @@ def verbose_print(message):
 
     logging.getLogger(__name__).debug(message)
 
+def _timed_cache(ttl):
+
+    """
+    Caches a zero-argument function's result for `ttl` seconds.
+
+    Steady-state calls become a tuple lookup, while transient changes (e.g.
+    Tor dying mid-run) are still picked up once the entry expires.
+    """
+
+    def decorator(func):
+
+        cached = None # (value, expiry) tuple
+
+        def wrapper():
+
+            nonlocal cached
+
+            if cached is not None and time.monotonic() < cached[1]:
+
+                return cached[0]
+
+            value = func()
+
+            cached = (value, time.monotonic() + ttl)
+
+            return value
+
+        def cache_clear():
+
+            nonlocal cached
+
+            cached = None
+
+        wrapper.cache_clear = cache_clear
+
+        return functools.wraps(func)(wrapper)
+
+    return decorator
+
+@_timed_cache(60)
+
 def is_tor_installed():
 
     """
     Checks if Tor is installed based on OS type.
-    
+
     Returns:
         bool: True if Tor is found and available, False otherwise
-        
+
     Notes:
         - On Linux/macOS: Checks if 'tor' command is in PATH
         - On Windows: Checks common Tor Browser and standalone installation paths
+        - The result is cached for 60 seconds; Tor is rarely installed or
+          removed mid-run.
     """
 
     os_type = get_os_type()
 
     if os_type == "Linux" or os_type == "macOS":
 
-        try:
+        # shutil.which scans PATH in-process; no shell or subprocess needed.
 
-            subprocess.check_output('which tor', shell=True)
+        if shutil.which('tor') is not None:
 
             return True
 
-        except subprocess.CalledProcessError:
-
-            verbose_print("Tor executable not found in PATH.")
+        verbose_print("Tor executable not found in PATH.")
 
-            return False
+        return False
 
     elif os_type == "Windows":
 
@@ -189,11 +426,7 @@ def is_tor_installed():
 
         # This is a simplification; a more robust check might be needed.
 
-        tor_path_tb = os.path.join(os.environ.get("PROGRAMFILES", "C:\\Program Files"), "Tor Browser", "Browser", "TorBrowser", "Tor", "tor.exe")
-
-        tor_path_system = os.path.join(os.environ.get("PROGRAMFILES", "C:\\Program Files"), "Tor", "tor.exe") # Example for standalone
-
-        if os.path.exists(tor_path_tb) or os.path.exists(tor_path_system):
+        if any(os.path.isfile(p) for p in _WIN_TOR_PATHS):
 
             verbose_print("Tor executable found in common Windows paths.")
 
@@ -219,23 +452,27 @@ def start_tor_service():
 
     if os_type == "Linux":
 
-        print(f"{white} [{green}+{white}]{green} Starting Tor service (systemctl)...{reset}")
+        print(f"{OK}Starting Tor service (systemctl)...{END}")
+
+        sys.stdout.flush() # Show the status line before the child writes to the terminal
 
-        os.system("sudo systemctl start tor")
+        subprocess.run(["sudo", "systemctl", "start", "tor"], check=False)
 
     elif os_type == "macOS":
 
-        print(f"{white} [{green}+{white}]{green} Starting Tor service (brew services)...{reset}")
+        print(f"{OK}Starting Tor service (brew services)...{END}")
+
+        sys.stdout.flush() # Show the status line before the child writes to the terminal
 
-        os.system("brew services start tor") # Assuming Tor installed via Homebrew
+        subprocess.run(["brew", "services", "start", "tor"], check=False) # Assuming Tor installed via Homebrew
 
     elif os_type == "Windows":
 
-        print(f"{white} [{green}+{white}]{cyan} On Windows, please ensure Tor is running, e.g., via Tor Browser, or by starting 'tor.exe' manually.{reset}")
+        print(f"{white} [{green}+{white}]{cyan} On Windows, please ensure Tor is running, e.g., via Tor Browser, or by starting 'tor.exe' manually.{END}")
 
     else:
 
-        print(f"{white} [{red}!{white}] {red}Unsupported OS for automatic Tor service start.{reset}")
+        print(f"{ERR}Unsupported OS for automatic Tor service start.{END}")
 
 def reload_tor_service():
 
@@ -247,25 +484,77 @@ def reload_tor_service():
 
     if os_type == "Linux":
 
-        print(f"{white} [{green}+{white}]{green} Reloading Tor service (systemctl)...{reset}")
+        print(f"{OK}Reloading Tor service (systemctl)...{END}")
 
-        os.system("sudo systemctl reload tor")
+        sys.stdout.flush() # Show the status line before the child writes to the terminal
+
+        subprocess.run(["sudo", "systemctl", "reload", "tor"], check=False)
 
     elif os_type == "macOS":
 
-        print(f"{white} [{green}+{white}]{green} Restarting Tor service (brew services) to reload circuit...{reset}")
+        print(f"{OK}Restarting Tor service (brew services) to reload circuit...{END}")
+
+        sys.stdout.flush() # Show the status line before the child writes to the terminal
 
-        os.system("brew services restart tor") # Homebrew's restart acts like a reload for new circuits
+        subprocess.run(["brew", "services", "restart", "tor"], check=False) # Homebrew's restart acts like a reload for new circuits
 
     elif os_type == "Windows":
 
-        print(f"{white} [{cyan}~{white}]{cyan} On Windows, for a new Tor circuit, you usually need to restart Tor Browser or its underlying Tor process manually.{reset}")
+        print(f"{INFO}On Windows, for a new Tor circuit, you usually need to restart Tor Browser or its underlying Tor process manually.{END}")
 
-        print(f"{white} [{cyan}~{white}]{cyan} This script cannot automate Tor circuit changes on Windows without direct control port access and specific Tor setup.{reset}")
+        print(f"{INFO}This script cannot automate Tor circuit changes on Windows without direct control port access and specific Tor setup.{END}")
 
     else:
 
-        print(f"{white} [{red}!{white}] {red}Unsupported OS for automatic Tor service reload.{reset}")
+        print(f"{ERR}Unsupported OS for automatic Tor service reload.{END}")
+
+# Pooled Tor control-port connection. Opening + authenticating a controller
+
+# per rotation is a socket and auth round trip we only need to pay once.
+
+_controller = None
+
+def _get_controller():
+
+    """Returns a connected, authenticated stem Controller, creating it lazily."""
+
+    global _controller
+
+    if _controller is None:
+
+        from stem.control import Controller
+
+        # Default control port is 9051, no password for default Tor installations
+
+        # If torrc has a HashedControlPassword, you'd need controller.authenticate("password")
+
+        _controller = Controller.from_port(port=9051)
+
+        _controller.authenticate()
+
+        verbose_print("Connected to Tor control port (connection will be reused).")
+
+    return _controller
+
+def _close_controller():
+
+    """Closes the pooled controller connection if one was opened."""
+
+    global _controller
+
+    if _controller is not None:
+
+        try:
+
+            _controller.close()
+
+        except Exception:
+
+            pass
+
+        _controller = None
+
+atexit.register(_close_controller)
 
 def change_ip_via_control_port():
 
@@ -279,75 +568,73 @@ def change_ip_via_control_port():
 
         return False
 
-    try:
-
-        # Default control port is 9051, no password for default Tor installations
-
-        # If torrc has a HashedControlPassword, you'd need controller.authenticate("password")
+    from stem import Signal
 
-        with Controller.from_port(port=9051) as controller:
+    for retry in range(2):
 
-            controller.authenticate()
+        try:
 
-            controller.signal(Signal.NEWNYM)
+            _get_controller().signal(Signal.NEWNYM)
 
-            print(f"{white} [{green}+{white}]{green} Sent NEWNYM signal to Tor for a new circuit.{reset}")
+            print(f"{OK}Sent NEWNYM signal to Tor for a new circuit.{END}")
 
             return True
 
-    except Exception as e:
-
-        verbose_print(f"Error sending NEWNYM signal: {e}")
+        except Exception as e:
 
-        print(f'{white} [{red}!{white}] {red}Failed to send NEWNYM signal via Tor control port: {e}. Falling back to service reload.{reset}')
+            # Drop the stale connection and reconnect once before giving up.
 
-        return False
+            _close_controller()
 
-def stop_tor_service_gracefully():
+            if retry == 0:
 
-    """Stops the Tor service gracefully based on OS type, trying control port first."""
+                verbose_print(f"Controller connection failed ({e}); reconnecting.")
 
-    os_type = get_os_type()
+                continue
 
-    verbose_print(f"Attempting to stop Tor service gracefully on {os_type}")
+            verbose_print(f"Error sending NEWNYM signal: {e}")
 
-    if STEM_AVAILABLE:
+            print(f'{ERR}Failed to send NEWNYM signal via Tor control port: {e}. Falling back to service reload.{END}')
 
-        try:
+    return False
 
-            with Controller.from_port(port=9051) as controller:
+def stop_tor_service_gracefully():
 
-                controller.authenticate()
+    """Stops the Tor service gracefully based on OS type, trying control port first."""
 
-                # Sending a SHUTDOWN signal is possible but often not ideal for stopping the service.
+    os_type = get_os_type()
 
-                # A better approach is to use OS service commands.
+    verbose_print(f"Attempting to stop Tor service gracefully on {os_type}")
 
-                verbose_print("Tor control port found, but using OS-specific stop command for service shutdown.")
+    # Note: service-managed Tor is stopped via the OS service commands below;
 
-        except Exception as e:
+    # probing the control port first would just add a connect + auth round trip
 
-            verbose_print(f"Could not connect to Tor control port for graceful shutdown check: {e}")
+    # to every shutdown (including the Ctrl-C handler) for no benefit.
 
     if os_type == "Linux":
 
-        print(f"{white} [{green}+{white}]{green} Stopping Tor service (systemctl)...{reset}")
+        print(f"{OK}Stopping Tor service (systemctl)...{END}")
 
-        os.system("sudo systemctl stop tor")
+        sys.stdout.flush() # Show the status line before the child writes to the terminal
+
+        subprocess.run(["sudo", "systemctl", "stop", "tor"], check=False)
 
     elif os_type == "macOS":
 
-        print(f"{white} [{green}+{white}]{green} Stopping Tor service (brew services)...{reset}")
+        print(f"{OK}Stopping Tor service (brew services)...{END}")
+
+        sys.stdout.flush() # Show the status line before the child writes to the terminal
 
-        os.system("brew services stop tor")
+        subprocess.run(["brew", "services", "stop", "tor"], check=False)
 
     elif os_type == "Windows":
 
-        print(f"{white} [{cyan}~{white}]{cyan} On Windows, if Tor Browser is used, close the browser to stop Tor. Otherwise, manually stop the Tor process.{reset}")
+        print(f"{INFO}On Windows, if Tor Browser is used, close the browser to stop Tor. Otherwise, manually stop the Tor process.{END}")
 
     else:
 
-        print(f"{white} [{red}!{white}] {red}Unsupported OS for automatic Tor service stop.{reset}")
+        print(f"{ERR}Unsupported OS for automatic Tor service stop.{END}")
 
 def configure_browser_for_tor():
 
@@ -359,37 +646,37 @@ def configure_browser_for_tor():
 
     os_type = get_os_type()
 
-    print(f"\n{white} [{green}+{white}]{green} To use Tor for anonymity, you need to configure your browser.{reset}")
+    print(f"\n{OK}To use Tor for anonymity, you need to configure your browser.{END}")
 
-    print(f"{white} [{green}+{white}]{green} Here's general guidance for common browsers:{reset}")
+    print(f"{OK}Here's general guidance for common browsers:{END}")
 
     if os_type == "Windows":
 
-        print(f"{white}   - {cyan}Firefox/Chrome (Windows):{reset} Go to browser settings -> Network Proxy. Select 'Manual proxy configuration' and set 'SOCKS Host' to '127.0.0.1' and 'Port' to '9050'. Select SOCKS v5. Leave HTTP/HTTPS proxies empty.")
+        print(f"{white}   - {cyan}Firefox/Chrome (Windows):{END} Go to browser settings -> Network Proxy. Select 'Manual proxy configuration' and set 'SOCKS Host' to '127.0.0.1' and 'Port' to '9050'. Select SOCKS v5. Leave HTTP/HTTPS proxies empty.")
 
-        print(f"{white}   - {cyan}Tor Browser (Recommended for Windows):{reset} Tor Browser is pre-configured to use Tor. Just use it!")
+        print(f"{white}   - {cyan}Tor Browser (Recommended for Windows):{END} Tor Browser is pre-configured to use Tor. Just use it!")
 
     elif os_type == "macOS":
 
-        print(f"{white}   - {cyan}Firefox/Chrome (macOS):{reset} Similar to Windows. Go to browser settings -> Network Proxy. Select 'Manual proxy configuration' and set 'SOCKS Host' to '127.0.0.1' and 'Port' to '9050'. Select SOCKS v5. Leave HTTP/HTTPS proxies empty.")
+        print(f"{white}   - {cyan}Firefox/Chrome (macOS):{END} Similar to Windows. Go to browser settings -> Network Proxy. Select 'Manual proxy configuration' and set 'SOCKS Host' to '127.0.0.1' and 'Port' to '9050'. Select SOCKS v5. Leave HTTP/HTTPS proxies empty.")
 
-        print(f"{white}   - {cyan}System-wide Proxy (macOS):{reset} Go to System Settings -> Network -> (Your active network interface) -> Details -> Proxies. Check 'SOCKS Proxy' and set '127.0.0.1' and '9050'.")
+        print(f"{white}   - {cyan}System-wide Proxy (macOS):{END} Go to System Settings -> Network -> (Your active network interface) -> Details -> Proxies. Check 'SOCKS Proxy' and set '127.0.0.1' and '9050'.")
 
-        print(f"{white}   - {cyan}Tor Browser (Recommended for macOS):{reset} Tor Browser is pre-configured to use Tor. Just use it!")
+        print(f"{white}   - {cyan}Tor Browser (Recommended for macOS):{END} Tor Browser is pre-configured to use Tor. Just use it!")
 
     elif os_type == "Linux":
 
-        print(f"{white}   - {cyan}Firefox/Chrome (Linux):{reset} Go to browser settings -> Network Proxy. Select 'Manual proxy configuration' and set 'SOCKS Host' to '127.0.0.1' and 'Port' to '9050'. Select SOCKS v5. Leave HTTP/HTTPS proxies empty.")
+        print(f"{white}   - {cyan}Firefox/Chrome (Linux):{END} Go to browser settings -> Network Proxy. Select 'Manual proxy configuration' and set 'SOCKS Host' to '127.0.0.1' and 'Port' to '9050'. Select SOCKS v5. Leave HTTP/HTTPS proxies empty.")
 
-        print(f"{white}   - {cyan}System-wide Proxy (Linux):{reset} This varies by desktop environment (e.g., GNOME, KDE). Look for 'Network Proxy' settings in your system settings.")
+        print(f"{white}   - {cyan}System-wide Proxy (Linux):{END} This varies by desktop environment (e.g., GNOME, KDE). Look for 'Network Proxy' settings in your system settings.")
 
-        print(f"{white}   - {cyan}Tor Browser (Recommended for Linux):{reset} Tor Browser is pre-configured to use Tor. Just use it!")
+        print(f"{white}   - {cyan}Tor Browser (Recommended for Linux):{END} Tor Browser is pre-configured to use Tor. Just use it!")
 
     else:
 
-        print(f"{white}   - {cyan}General Guidance:{reset} In your browser's network settings, look for proxy configuration. Set a SOCKS5 proxy to `127.0.0.1` on port `9050`.")
+        print(f"{white}   - {cyan}General Guidance:{END} In your browser's network settings, look for proxy configuration. Set a SOCKS5 proxy to `127.0.0.1` on port `9050`.")
 
-    print(f"{white} [{green}+{white}]{green} Remember to revert your browser's proxy settings when you're done using TorNet!{reset}")
+    print(f"{OK}Remember to revert your browser's proxy settings when you're done using TorNet!{END}")
 
 def initialize_environment():
 
@@ -397,9 +684,7 @@ def initialize_environment():
 
     install_pip()
 
-    install_requests()
-
-    install_stem() # Install stem library
+    install_python_deps(['requests', 'stem']) # One pip invocation for both
 
     install_tor()
 
@@ -409,11 +694,13 @@ def initialize_environment():
 
     configure_browser_for_tor() # Add browser configuration guidance
 
+    sys.stdout.flush() # Show the setup output before the first rotation wait
+
 def print_start_message():
 
-    print(f"{white} [{green}+{white}]{green} Tor service started. Please wait a minute for Tor to connect.{reset}")
+    print(f"{OK}Tor service started. Please wait a minute for Tor to connect.{END}")
 
-    print(f"{white} [{green}+{white}]{green} Your current OS is: {platform.system()} {platform.release()} ({platform.machine()}){reset}")
+    print(f"{OK}Your current OS is: {platform.system()} {platform.release()} ({platform.machine()}){END}")
 
 def ma_ip():
 
@@ -427,29 +714,65 @@ def ma_ip():
 
         return ma_ip_normal()
 
+# Cached briefly so tight ma_ip() loops don't probe (or fork pgrep) on
+
+# every call.
+
+@_timed_cache(5)
+
 def is_tor_running():
 
     """Checks if Tor process is running based on OS type."""
 
+    return _probe_tor_running()
+
+def _probe_tor_running():
+
+    """Probes for a running Tor: pooled controller, SOCKS port, then pgrep."""
+
     os_type = get_os_type()
 
     verbose_print(f"Checking if Tor is running on {os_type}")
 
+    # An already-connected controller is a purely local check — no process
+
+    # creation and no new sockets.
+
+    if STEM_AVAILABLE and _controller is not None and _controller.is_alive():
+
+        verbose_print("Tor confirmed running via existing control-port connection.")
+
+        return True
+
+    # A quick connect to the SOCKS port is far cheaper than forking pgrep.
+
+    try:
+
+        with socket.create_connection(('127.0.0.1', 9050), timeout=0.2):
+
+            verbose_print("Tor SOCKS port is accepting connections.")
+
+            return True
+
+    except OSError:
+
+        pass
+
     if os_type == "Linux" or os_type == "macOS":
 
-        try:
+        # Pass an argv list so pgrep runs without an intermediate shell.
+
+        result = subprocess.run(['pgrep', '-x', 'tor'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-            subprocess.check_output('pgrep -x tor', shell=True)
+        if result.returncode == 0:
 
             verbose_print("Tor process found via pgrep.")
 
             return True
 
-        except subprocess.CalledProcessError:
+        verbose_print("Tor process not found via pgrep.")
 
-            verbose_print("Tor process not found via pgrep.")
-
-            return False
+        return False
 
     elif os_type == "Windows":
 
@@ -467,17 +790,27 @@ def is_tor_running():
 
     return False
 
+@functools.lru_cache(maxsize=1024)
+
 def get_ip_geolocation(ip_address):
 
-    """Fetches approximate geolocation (country) for an IP address."""
+    """
+    Fetches approximate geolocation (country) for an IP address.
+
+    Results are cached per IP: Tor exit relays recur frequently during long
+    rotation runs, so repeat lookups become a dict hit instead of an HTTPS
+    round trip.
+    """
 
     if not ip_address:
 
         return "Unknown"
 
+    import requests
+
     try:
 
-        response = requests.get(f"https://ipapi.co/{ip_address}/json/", timeout=5)
+        response = _get_session().get(f"https://ipapi.co/{ip_address}/json/", timeout=5)
 
         response.raise_for_status()
 
@@ -495,21 +828,15 @@ def get_ip_geolocation(ip_address):
 
 def ma_ip_tor():
 
-    url = 'https://api.ipify.org'
-
-    proxies = {
-
-        'http': 'socks5h://127.0.0.1:9050',
+    import requests
 
-        'https': 'socks5h://127.0.0.1:9050'
-
-    }
+    url = 'https://api.ipify.org'
 
     try:
 
         verbose_print("Fetching IP via Tor proxy.")
 
-        response = requests.get(url, proxies=proxies, timeout=30)
+        response = _get_tor_session().get(url, timeout=30)
 
         response.raise_for_status()
 
@@ -517,7 +844,7 @@ def ma_ip_tor():
 
     except requests.exceptions.Timeout:
 
-        print(f'{white} [{red}!{white}] {red}Tor connection timed out. Tor may not be fully connected yet.{reset}')
+        print(f'{ERR}Tor connection timed out. Tor may not be fully connected yet.{END}')
 
         verbose_print("Tor IP fetch timed out.")
 
@@ -525,7 +852,7 @@ def ma_ip_tor():
 
     except requests.RequestException as e:
 
-        print(f'{white} [{red}!{white}] {red}Having trouble connecting to the Tor network: {e}. Is Tor running and connected?{reset}')
+        print(f'{ERR}Having trouble connecting to the Tor network: {e}. Is Tor running and connected?{END}')
 
         verbose_print(f"Error fetching IP via Tor: {e}")
 
@@ -533,11 +860,13 @@ def ma_ip_tor():
 
 def ma_ip_normal():
 
+    import requests
+
     try:
 
         verbose_print("Fetching normal IP.")
 
-        response = requests.get('https://api.ipify.org', timeout=10)
+        response = _get_session().get('https://api.ipify.org', timeout=10)
 
         response.raise_for_status()
 
@@ -545,7 +874,7 @@ def ma_ip_normal():
 
     except requests.exceptions.Timeout:
 
-        print(f'{white} [{red}!{white}] {red}Normal IP fetch timed out. Check your internet connection.{reset}')
+        print(f'{ERR}Normal IP fetch timed out. Check your internet connection.{END}')
 
         verbose_print("Normal IP fetch timed out.")
 
@@ -553,13 +882,13 @@ def ma_ip_normal():
 
     except requests.RequestException as e:
 
-        print(f'{white} [{red}!{white}] {red}Having trouble fetching the IP address: {e}. Please check your internet connection.{reset}')
+        print(f'{ERR}Having trouble fetching the IP address: {e}. Please check your internet connection.{END}')
 
         verbose_print(f"Error fetching normal IP: {e}")
 
         return None
 
-def change_ip(max_retries=3, ip_check_interval=5):
+def change_ip(previous_ip=None, max_retries=3, ip_check_interval=5):
 
     """
 
@@ -567,15 +896,21 @@ def change_ip(max_retries=3, ip_check_interval=5):
 
     Tries NEWNYM signal first, then falls back to service reload.
 
+    Pass `previous_ip` (e.g. the IP from the last rotation) to skip the
+
+    initial Tor fetch used for change verification — this halves the
+
+    HTTPS-over-Tor round trips in the rotation loop.
+
     """
 
     verbose_print("Attempting to change IP.")
 
-    current_ip_before_change = ma_ip_tor() # Get current IP to verify change
+    current_ip_before_change = previous_ip if previous_ip else ma_ip_tor() # Get current IP to verify change
 
     if not current_ip_before_change:
 
-        print(f'{white} [{red}!{white}] {red}Could not get current Tor IP. Cannot verify IP change.{reset}')
+        print(f'{ERR}Could not get current Tor IP. Cannot verify IP change.{END}')
 
         # Proceed with change anyway, as Tor might just be slow to connect
 
@@ -583,7 +918,7 @@ def change_ip(max_retries=3, ip_check_interval=5):
 
     for attempt in range(1, max_retries + 1):
 
-        print(f"{white} [{cyan}~{white}]{cyan} IP change attempt {attempt}/{max_retries}...{reset}")
+        print(f"{INFO}IP change attempt {attempt}/{max_retries}...{END}")
 
         # Try control port first if available
 
@@ -603,17 +938,17 @@ def change_ip(max_retries=3, ip_check_interval=5):
 
         if new_ip and new_ip != current_ip_before_change:
 
-            print(f'{white} [{green}+{white}]{green} Successfully changed IP.{reset}')
+            print(f'{OK}Successfully changed IP.{END}')
 
             return new_ip
 
         elif new_ip and new_ip == current_ip_before_change:
 
-            print(f'{white} [{yellow}WARNING{white}] {yellow}IP address did not change on attempt {attempt}. Retrying...{reset}')
+            print(f'{WARN}IP address did not change on attempt {attempt}. Retrying...{END}')
 
         else:
 
-            print(f'{white} [{yellow}WARNING{white}] {yellow}Failed to obtain new IP on attempt {attempt}. Retrying...{reset}')
+            print(f'{WARN}Failed to obtain new IP on attempt {attempt}. Retrying...{END}')
 
         
 
@@ -623,45 +958,71 @@ def change_ip(max_retries=3, ip_check_interval=5):
 
         
 
-    print(f'{white} [{red}!{white}] {red}Failed to change IP after {max_retries} attempts.{reset}')
+    print(f'{ERR}Failed to change IP after {max_retries} attempts.{END}')
 
     return None # Return None if IP change ultimately failed
 
+# Set by the signal handler to break out of the rotation loop promptly,
+
+# letting sessions and the controller connection close cleanly instead of
+
+# being torn down mid-sleep by exit().
+
+_stop_event = threading.Event()
+
 def change_ip_repeatedly(interval, count):
 
+    last_ip = None
+
     if count == 0:
 
         while True:
 
-            print(f"\n{white} [{cyan}~{white}]{cyan} Waiting {interval} seconds before changing IP...{reset}")
+            print(f"\n{INFO}Waiting {interval} seconds before changing IP...{END}")
+
+            sys.stdout.flush() # Show the wait message before sleeping
+
+            if _stop_event.wait(interval):
 
-            time.sleep(interval)
+                break
 
-            new_ip = change_ip()
+            new_ip = change_ip(previous_ip=last_ip)
 
             if new_ip:
 
+                last_ip = new_ip
+
                 print_ip(new_ip)
 
+            sys.stdout.flush() # One flush per rotation cycle
+
     else:
 
         for i in range(count):
 
-            print(f"\n{white} [{cyan}~{white}]{cyan} Waiting {interval} seconds before changing IP ({i+1}/{count})...{reset}")
+            print(f"\n{INFO}Waiting {interval} seconds before changing IP ({i+1}/{count})...{END}")
+
+            sys.stdout.flush() # Show the wait message before sleeping
 
-            time.sleep(interval)
+            if _stop_event.wait(interval):
 
-            new_ip = change_ip()
+                break
+
+            new_ip = change_ip(previous_ip=last_ip)
 
             if new_ip:
 
+                last_ip = new_ip
+
                 print_ip(new_ip)
 
+            sys.stdout.flush() # One flush per rotation cycle
+
 def print_ip(ip):
 
     country = get_ip_geolocation(ip)
 
-    print(f'{white} [{green}+{white}]{green} Your IP has been changed to {white}:{green} {ip} {white}({country}){reset}')
+    print(f'{OK}Your IP has been changed to {white}:{green} {ip} {white}({country}){END}')
 
 def auto_fix():
 
@@ -669,9 +1030,7 @@ def auto_fix():
 
     install_pip()
 
-    install_requests()
-
-    install_stem() # Ensure stem is installed during auto-fix
+    install_python_deps(['requests', 'stem']) # Ensure both are installed during auto-fix
 
     install_tor()
 
@@ -679,7 +1038,9 @@ def auto_fix():
 
     # If it's a local script, this line should be removed or adapted.
 
-    print(f"{white} [{cyan}~{white}]{cyan} Assuming 'tornet' is a pip-installable package. If not, this step might not apply.{reset}")
+    print(f"{INFO}Assuming 'tornet' is a pip-installable package. If not, this step might not apply.{END}")
+
+    sys.stdout.flush() # Show the status line before pip writes to the inherited stdout
 
     try:
 
@@ -687,7 +1048,7 @@ def auto_fix():
 
     except subprocess.CalledProcessError:
 
-        print(f"{white} [{yellow}WARNING{white}] {yellow}Could not upgrade {TOOL_NAME} via pip. If this is a local script, ignore this warning.{reset}")
+        print(f"{WARN}Could not upgrade {TOOL_NAME} via pip. If this is a local script, ignore this warning.{END}")
 
 def stop_services():
 
@@ -695,39 +1056,85 @@ def stop_services():
 
     stop_tor_service_gracefully()
 
-    os.system("pkill -f tornet > /dev/null 2>&1") # Kills any running tornet script
+    subprocess.run(["pkill", "-f", "tornet"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) # Kills any running tornet script
 
-    print(f"{white} [{green}+{white}]{green} Tor services and {TOOL_NAME} processes stopped.{reset}")
+    print(f"{OK}Tor services and {TOOL_NAME} processes stopped.{END}")
 
 def signal_handler(sig, frame):
 
+    # No exit() here: setting the event lets the rotation loop's wait return,
+
+    # so main() unwinds normally and atexit can close sessions/controller.
+
+    _stop_event.set()
+
     stop_services()
 
-    print(f"\n{white} [{red}!{white}] {red}Program terminated by user.{reset}")
+    print(f"\n{ERR}Program terminated by user.{END}")
+
+    sys.stdout.flush()
+
+# Lightweight endpoints raced in parallel; the check succeeds as soon as any
+
+# of them answers, instead of trying one host serially with retries.
+
+_CONNECTIVITY_ENDPOINTS = (
+
+    'http://www.google.com/generate_204',
+
+    'http://cloudflare.com/cdn-cgi/trace',
+
+    'http://1.1.1.1',
 
-    exit(0)
+)
 
 def check_internet_connection():
 
-    print(f"{white} [{cyan}~{white}]{cyan} Checking internet connection...{reset}")
+    import requests
 
-    for _ in range(3): # Try a few times
+    print(f"{INFO}Checking internet connection...{END}")
 
-        time.sleep(1)
+    sys.stdout.flush() # Visible during the probe window, not after it
 
-        try:
+    session = _get_session()
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(_CONNECTIVITY_ENDPOINTS))
+
+    futures = [executor.submit(session.get, url, timeout=3) for url in _CONNECTIVITY_ENDPOINTS]
+
+    try:
+
+        for future in concurrent.futures.as_completed(futures, timeout=3):
+
+            try:
+
+                future.result()
+
+            except requests.RequestException:
 
-            requests.get('http://www.google.com', timeout=3)
+                continue
 
-            print(f"{white} [{green}+{white}]{green} Internet connection OK.{reset}")
+            print(f"{OK}Internet connection OK.{END}")
 
             return True
 
-        except requests.RequestException:
+    except concurrent.futures.TimeoutError:
 
-            print(f"{white} [{red}!{white}] {red}Internet connection failed. Retrying...{reset}")
+        pass
+
+    finally:
+
+        # Cancel pending probes by hand: shutdown(cancel_futures=True) needs
+
+        # Python 3.9+, and this tool supports 3.6.
+
+        for future in futures:
 
-    print(f"{white} [{red}!{white}] {red}Could not establish internet connection. Exiting.{reset}")
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+    print(f"{ERR}Could not establish internet connection. Exiting.{END}")
 
     exit(1)
 
@@ -735,6 +1142,10 @@ def main():
 
     global VERBOSE_MODE # Declare global to modify
 
+    import argparse
+
+    _enable_buffered_stdout()
+
     signal.signal(signal.SIGINT, signal_handler)
 
     signal.signal(signal.SIGQUIT, signal_handler)
@@ -779,7 +1190,7 @@ def main():
 
     if not is_tor_installed():
 
-        print(f"{white} [{red}!{white}] {red}Tor is not installed or not found. Please install Tor (e.g., `sudo apt install tor` on Debian/Ubuntu, `brew install tor` on macOS, or Tor Browser on Windows) and try again.{reset}")
+        print(f"{ERR}Tor is not installed or not found. Please install Tor (e.g., `sudo apt install tor` on Debian/Ubuntu, `brew install tor` on macOS, or Tor Browser on Windows) and try again.{END}")
 
         return
 
@@ -787,7 +1198,7 @@ def main():
 
         auto_fix()
 
-        print(f"{white} [{green}+{white}]{green} Auto-fix complete.{reset}")
+        print(f"{OK}Auto-fix complete.{END}")
 
         return
 
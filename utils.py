@@ -6,9 +6,15 @@ Handles installation and system management tasks
 
 import os
 import sys
+import time
 import subprocess
-import platform
-import shutil
+import functools
+from collections import deque
+from importlib.util import find_spec
+
+# platform and shutil are imported lazily inside the functions that need
+# them: callers that only want run_command or the color constants shouldn't
+# pay their import cost at cold start.
 
 # ANSI color codes for consistent output
 GREEN = "\033[92m"
@@ -18,54 +24,163 @@ RESET = "\033[0m"
 CYAN = "\033[36m"
 YELLOW = "\033[93m"
 
+# Interpreter version string, constant for the process lifetime.
+_PY_VERSION = sys.version.split()[0]
+
+# Colored message prefixes assembled once; status lines reuse these instead
+# of re-interpolating the same f-string pieces on every print.
+_INFO_PREFIX = f"{WHITE} [{CYAN}~{WHITE}]{CYAN} "
+_OK_PREFIX = f"{WHITE} [{GREEN}+{WHITE}]{GREEN} "
+_WARN_PREFIX = f"{WHITE} [{YELLOW}!{WHITE}] {YELLOW}"
+_ERR_PREFIX = f"{WHITE} [{RED}!{WHITE}] {RED}"
+
+
+def _log(prefix, message):
+    """
+    Print a colored status line with the shared reset suffix.
+    """
+    print(prefix + message + RESET)
+
 
 def run_command(command, description=None, check_success=True):
     """
-    Execute a shell command with proper error handling.
-    
+    Execute a command with proper error handling.
+
+    Passing an argv list (preferred) runs the command directly without
+    forking an intermediate shell; a plain string falls back to shell
+    execution for callers that genuinely need shell parsing. Argv commands
+    are spawned on CPython's posix_spawn fast path (argv[0] resolved to a
+    full path, no preexec_fn, close_fds off), which is substantially cheaper
+    than fork+exec when the parent process is large.
+
     Args:
-        command (str): Command to execute
+        command (list or str): Command argv list, or a legacy shell string
         description (str): Description of what the command does
         check_success (bool): Whether to check for successful execution
-        
+
     Returns:
         bool: True if command succeeded, False otherwise
     """
     if description:
-        print(f"{WHITE} [{CYAN}~{WHITE}]{CYAN} {description}{RESET}")
-    
+        _log(_INFO_PREFIX, description)
+
+    use_shell = isinstance(command, str)
+    display = command if use_shell else ' '.join(command)
+    if not use_shell:
+        # posix_spawn is only taken when the executable is an absolute path;
+        # the cached which() lookup makes this resolution effectively free.
+        resolved = _which_cached(command[0])
+        if resolved:
+            command = [resolved, *command[1:]]
+    # With block-buffered stdout (see tornet), the description would otherwise
+    # sit invisible in the buffer for the whole install; flush it before the
+    # child (and any sudo prompt) takes over the terminal.
+    sys.stdout.flush()
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        if check_success and result.returncode != 0:
-            print(f"{WHITE} [{RED}!{WHITE}] {RED}Command failed: {command}{RESET}")
-            print(f"{WHITE} [{RED}!{WHITE}] {RED}Error: {result.stderr.strip()}{RESET}")
+        # Discard stdout and keep only a tail of stderr: installer commands
+        # (apt, pip, ...) can emit megabytes of text that is only ever shown
+        # on failure, so buffering it all in memory is wasted work.
+        process = subprocess.Popen(command, shell=use_shell,
+                                   close_fds=use_shell,
+                                   stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.PIPE, text=True)
+        stderr_tail = deque(process.stderr, maxlen=50)
+        process.stderr.close()
+        returncode = process.wait()
+        if check_success and returncode != 0:
+            _log(_ERR_PREFIX, f"Command failed: {display}")
+            _log(_ERR_PREFIX, f"Error: {''.join(stderr_tail).strip()}")
             return False
         return True
     except Exception as e:
-        print(f"{WHITE} [{RED}!{WHITE}] {RED}Exception running command '{command}': {e}{RESET}")
+        _log(_ERR_PREFIX, f"Exception running command '{display}': {e}")
         return False
 
 
+# Memoized shutil.which: commands like pip and tor are probed from several
+# call sites, and each uncached lookup walks every PATH entry.
+@functools.lru_cache(maxsize=None)
+def _which_cached(command):
+    import shutil
+    return shutil.which(command)
+
+
 def is_command_available(command):
     """
     Check if a command is available in the system PATH.
-    
+
+    Bare names are answered from a one-shot PATH scan (O(1) membership);
+    paths containing a separator fall back to a cached shutil.which lookup.
+    Call clear_command_cache() if PATH changes at runtime (e.g. after an
+    install).
+
     Args:
         command (str): Command name to check
-        
+
     Returns:
         bool: True if command is available, False otherwise
     """
-    return shutil.which(command) is not None
+    if os.sep in command:
+        return _which_cached(command) is not None
+    return command in _available_commands()
+
+
+# Recognized executable extensions on Windows, used to register both
+# 'tor.exe' and 'tor' in the command set.
+_PATHEXTS = frozenset(
+    ext.upper() for ext in os.environ.get('PATHEXT', '.COM;.EXE;.BAT;.CMD').split(os.pathsep) if ext
+) if sys.platform == 'win32' else frozenset()
+
+
+@functools.lru_cache(maxsize=1)
+def _available_commands():
+    """
+    Scan PATH once and return the set of executable command names found.
+
+    Probing each command with an individual shutil.which call walks PATH
+    (stat'ing candidates) once per lookup; this amortizes all of them into a
+    single directory read per PATH entry with O(1) membership tests.
+
+    Returns:
+        frozenset: Names of executables available on PATH
+    """
+    commands = set()
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mode & 0o111:
+                            commands.add(entry.name)
+                            base, ext = os.path.splitext(entry.name)
+                            if ext.upper() in _PATHEXTS:
+                                commands.add(base)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return frozenset(commands)
 
 
+def clear_command_cache():
+    """
+    Invalidate cached command lookups (use after PATH changes).
+    """
+    _which_cached.cache_clear()
+    _available_commands.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def get_os_info():
     """
-    Get detailed OS information.
-    
+    Get detailed OS information (built once per process).
+
     Returns:
         dict: Dictionary containing OS details
     """
+    import platform
     return {
         'system': platform.system(),
         'release': platform.release(),
@@ -75,144 +190,243 @@ def get_os_info():
     }
 
 
+def _apt_lists_fresh(max_age=3600):
+    """
+    Check whether apt's package metadata was refreshed recently.
+
+    `apt update` costs a network round trip to every mirror; skipping it when
+    the lists are newer than `max_age` seconds makes back-to-back installs
+    much faster.
+
+    Args:
+        max_age (int): Maximum metadata age in seconds to count as fresh
+
+    Returns:
+        bool: True if the cached package lists are fresh enough
+    """
+    for cache_path in ('/var/cache/apt/pkgcache.bin', '/var/lib/apt/lists'):
+        try:
+            if time.time() - os.stat(cache_path).st_mtime < max_age:
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def _apt_update_if_stale():
+    """
+    Run `sudo apt update` unless the package lists are already fresh.
+
+    Returns:
+        bool: True if the lists are fresh or the update succeeded
+    """
+    if _apt_lists_fresh():
+        return True
+    return run_command(["sudo", "apt", "update"], "Updating apt package lists")
+
+
+# Linux package managers in preference order with their install argv
+# templates; '{pkg}' is substituted with the package to install. A single
+# table keeps install_pip/install_tor from duplicating the probe chain.
+_LINUX_PM = (
+    ('apt', ["sudo", "apt", "install", "-y", "{pkg}"]),
+    ('yum', ["sudo", "yum", "install", "-y", "{pkg}"]),
+    ('dnf', ["sudo", "dnf", "install", "-y", "{pkg}"]),
+    ('pacman', ["sudo", "pacman", "-S", "--noconfirm", "{pkg}"]),
+)
+
+
+def _install_linux(package, overrides=None):
+    """
+    Install a package with the first available Linux package manager.
+
+    Consults the cached PATH scan once and walks the manager table, so the
+    dispatch costs one set lookup per manager.
+
+    Args:
+        package (str): Distro package name to install
+        overrides (dict): Optional per-manager package name overrides
+            (e.g. {'pacman': 'python-pip'})
+
+    Returns:
+        bool or None: The install result, or None if no supported package
+            manager was found
+    """
+    avail = _available_commands()
+    for manager, argv_template in _LINUX_PM:
+        if manager not in avail:
+            continue
+        if manager == 'apt' and not _apt_update_if_stale():
+            return False
+        pkg = (overrides or {}).get(manager, package)
+        argv = [arg.replace('{pkg}', pkg) for arg in argv_template]
+        return run_command(argv, f"Installing {pkg} via {manager}")
+    return None
+
+
 def install_pip():
     """
     Ensure pip is installed and available.
     """
-    print(f"{WHITE} [{CYAN}~{WHITE}]{CYAN} Checking pip installation...{RESET}")
-    
+    _log(_INFO_PREFIX, "Checking pip installation...")
+
     if is_command_available('pip') or is_command_available('pip3'):
-        print(f"{WHITE} [{GREEN}+{WHITE}]{GREEN} pip is already installed.{RESET}")
+        _log(_OK_PREFIX, "pip is already installed.")
         return True
-    
-    os_type = platform.system()
-    
-    if os_type == "Linux":
-        # Try different package managers
-        if is_command_available('apt'):
-            return run_command("sudo apt update && sudo apt install -y python3-pip", 
-                             "Installing pip via apt")
-        elif is_command_available('yum'):
-            return run_command("sudo yum install -y python3-pip", 
-                             "Installing pip via yum")
-        elif is_command_available('dnf'):
-            return run_command("sudo dnf install -y python3-pip", 
-                             "Installing pip via dnf")
-        elif is_command_available('pacman'):
-            return run_command("sudo pacman -S --noconfirm python-pip", 
-                             "Installing pip via pacman")
-    elif os_type == "Darwin":  # macOS
+
+    if sys.platform.startswith('linux'):
+        result = _install_linux('python3-pip', overrides={'pacman': 'python-pip'})
+        if result is not None:
+            return result
+    elif sys.platform == 'darwin':  # macOS
         if is_command_available('brew'):
-            return run_command("brew install python", "Installing pip via Homebrew")
+            return run_command(["brew", "install", "python"], "Installing pip via Homebrew")
         else:
-            print(f"{WHITE} [{YELLOW}!{WHITE}] {YELLOW}Please install Homebrew first or install pip manually.{RESET}")
-    elif os_type == "Windows":
-        print(f"{WHITE} [{YELLOW}!{WHITE}] {YELLOW}On Windows, pip should come with Python. Please reinstall Python from python.org{RESET}")
+            _log(_WARN_PREFIX, "Please install Homebrew first or install pip manually.")
+    elif sys.platform == 'win32':
+        _log(_WARN_PREFIX, "On Windows, pip should come with Python. Please reinstall Python from python.org")
     
-    print(f"{WHITE} [{RED}!{WHITE}] {RED}Could not install pip automatically. Please install it manually.{RESET}")
+    _log(_ERR_PREFIX, "Could not install pip automatically. Please install it manually.")
     return False
 
 
+@functools.lru_cache(maxsize=None)
+def _module_available(name):
+    """
+    Check whether an importable module exists, memoized per process.
+
+    Loaded modules are answered from sys.modules; otherwise the spec search
+    runs once and later probes are a dict hit. Invalidated by
+    refresh_system_requirements() after installs.
+
+    Args:
+        name (str): Importable module name
+
+    Returns:
+        bool: True if the module can be imported
+    """
+    return name in sys.modules or find_spec(name) is not None
+
+
 def install_requests():
     """
     Install the requests library for HTTP operations.
     """
-    print(f"{WHITE} [{CYAN}~{WHITE}]{CYAN} Checking requests library...{RESET}")
-    
-    try:
-        import requests
-        print(f"{WHITE} [{GREEN}+{WHITE}]{GREEN} requests library is already installed.{RESET}")
+    _log(_INFO_PREFIX, "Checking requests library...")
+
+    # _module_available answers the presence question from filesystem metadata
+    # without executing the package (requests pulls in urllib3 etc. on import).
+    if _module_available('requests'):
+        _log(_OK_PREFIX, "requests library is already installed.")
         return True
-    except ImportError:
-        print(f"{WHITE} [{CYAN}~{WHITE}]{CYAN} Installing requests library...{RESET}")
-        return run_command(f"{sys.executable} -m pip install requests", 
-                         "Installing requests via pip")
+
+    _log(_INFO_PREFIX, "Installing requests library...")
+    return run_command([sys.executable, "-m", "pip", "install", "requests"],
+                     "Installing requests via pip")
 
 
 def install_stem():
     """
     Install the stem library for Tor control operations.
     """
-    print(f"{WHITE} [{CYAN}~{WHITE}]{CYAN} Checking stem library...{RESET}")
-    
-    try:
-        import stem
-        print(f"{WHITE} [{GREEN}+{WHITE}]{GREEN} stem library is already installed.{RESET}")
+    _log(_INFO_PREFIX, "Checking stem library...")
+
+    if _module_available('stem'):
+        _log(_OK_PREFIX, "stem library is already installed.")
+        return True
+
+    _log(_INFO_PREFIX, "Installing stem library...")
+    return run_command([sys.executable, "-m", "pip", "install", "stem"],
+                     "Installing stem via pip")
+
+
+def install_python_deps(packages):
+    """
+    Install any missing Python packages with a single pip invocation.
+
+    Batching packages into one `pip install` amortizes pip's startup and
+    network setup instead of paying them once per package.
+
+    Args:
+        packages (iterable): Importable package names (e.g. ['requests', 'stem'])
+
+    Returns:
+        bool: True if all packages are present or were installed successfully
+    """
+    missing = [package for package in packages if not _module_available(package)]
+
+    if not missing:
+        _log(_OK_PREFIX, "All Python dependencies are already installed.")
         return True
-    except ImportError:
-        print(f"{WHITE} [{CYAN}~{WHITE}]{CYAN} Installing stem library...{RESET}")
-        return run_command(f"{sys.executable} -m pip install stem", 
-                         "Installing stem via pip")
+
+    return run_command([sys.executable, "-m", "pip", "install", *missing],
+                     f"Installing {', '.join(missing)} via pip")
 
 
 def install_tor():
     """
     Install Tor service based on the operating system.
     """
-    print(f"{WHITE} [{CYAN}~{WHITE}]{CYAN} Checking Tor installation...{RESET}")
+    _log(_INFO_PREFIX, "Checking Tor installation...")
     
     if is_command_available('tor'):
-        print(f"{WHITE} [{GREEN}+{WHITE}]{GREEN} Tor is already installed.{RESET}")
+        _log(_OK_PREFIX, "Tor is already installed.")
         return True
     
-    os_type = platform.system()
-    
-    if os_type == "Linux":
-        if is_command_available('apt'):
-            return run_command("sudo apt update && sudo apt install -y tor", 
-                             "Installing Tor via apt")
-        elif is_command_available('yum'):
-            return run_command("sudo yum install -y tor", 
-                             "Installing Tor via yum")
-        elif is_command_available('dnf'):
-            return run_command("sudo dnf install -y tor", 
-                             "Installing Tor via dnf")
-        elif is_command_available('pacman'):
-            return run_command("sudo pacman -S --noconfirm tor", 
-                             "Installing Tor via pacman")
-    elif os_type == "Darwin":  # macOS
+    if sys.platform.startswith('linux'):
+        result = _install_linux('tor')
+        if result is not None:
+            return result
+    elif sys.platform == 'darwin':  # macOS
         if is_command_available('brew'):
-            return run_command("brew install tor", "Installing Tor via Homebrew")
+            return run_command(["brew", "install", "tor"], "Installing Tor via Homebrew")
         else:
-            print(f"{WHITE} [{YELLOW}!{WHITE}] {YELLOW}Please install Homebrew first: /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"{RESET}")
-    elif os_type == "Windows":
-        print(f"{WHITE} [{YELLOW}!{WHITE}] {YELLOW}On Windows, please download and install Tor Browser from https://www.torproject.org{RESET}")
-        print(f"{WHITE} [{YELLOW}!{WHITE}] {YELLOW}Or install Tor as a service manually.{RESET}")
+            _log(_WARN_PREFIX, "Please install Homebrew first: /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"")
+    elif sys.platform == 'win32':
+        _log(_WARN_PREFIX, "On Windows, please download and install Tor Browser from https://www.torproject.org")
+        _log(_WARN_PREFIX, "Or install Tor as a service manually.")
         return False
     
-    print(f"{WHITE} [{RED}!{WHITE}] {RED}Could not install Tor automatically. Please install it manually.{RESET}")
+    _log(_ERR_PREFIX, "Could not install Tor automatically. Please install it manually.")
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def check_system_requirements():
     """
     Check if all system requirements are met.
-    
+
+    The result is cached for the process; call refresh_system_requirements()
+    to re-probe after installing packages.
+
     Returns:
         dict: Dictionary with requirement status
     """
+    exes = _available_commands()
     requirements = {
         'python': sys.version_info >= (3, 6),
-        'pip': is_command_available('pip') or is_command_available('pip3'),
-        'tor': is_command_available('tor'),
+        'pip': bool(exes & {'pip', 'pip3'}),
+        'tor': 'tor' in exes,
         'internet': False  # Will be checked by main program
     }
     
-    try:
-        import requests
-        requirements['requests'] = True
-    except ImportError:
-        requirements['requests'] = False
-        
-    try:
-        import stem
-        requirements['stem'] = True
-    except ImportError:
-        requirements['stem'] = False
-    
+    # Already-imported modules are answered by a sys.modules dict lookup;
+    # only unloaded ones fall back to the filesystem spec search.
+    requirements['requests'] = _module_available('requests')
+    requirements['stem'] = _module_available('stem')
+
     return requirements
 
 
+def refresh_system_requirements():
+    """
+    Invalidate the cached requirement check (use after installing packages).
+    """
+    clear_command_cache()
+    _module_available.cache_clear()
+    check_system_requirements.cache_clear()
+
+
 def print_system_info():
     """
     Print detailed system information for debugging.
@@ -223,7 +437,7 @@ def print_system_info():
     print(f"{WHITE} [{CYAN}+{WHITE}]{CYAN} System Information:{RESET}")
     print(f"{WHITE}   OS: {os_info['system']} {os_info['release']}{RESET}")
     print(f"{WHITE}   Architecture: {os_info['machine']}{RESET}")
-    print(f"{WHITE}   Python: {sys.version.split()[0]}{RESET}")
+    print(f"{WHITE}   Python: {_PY_VERSION}{RESET}")
     
     print(f"{WHITE} [{CYAN}+{WHITE}]{CYAN} Requirements Status:{RESET}")
     for req, status in requirements.items():